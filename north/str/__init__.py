@@ -1,95 +1,100 @@
 import re
+from functools import lru_cache
 
+_WORD_DELIMITERS = " _-"
 
-def _space_numbers(match: re.Match[str]) -> str:
-    return f"{match.group(1)} {match.group(2)} {match.group(3)}"
+_NUM_BOUNDARY_RE = re.compile(r"([a-zA-Z])(\d+)([a-zA-Z]?)")
+_WORD_SPLIT_RE = re.compile(r"[ _-]+")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]+")
+
+_ALREADY_CAMEL_RE = re.compile(r"[A-Z][a-zA-Z]*")
+_ALREADY_LOWER_CAMEL_RE = re.compile(r"[a-z][a-zA-Z]*")
+_ALREADY_SNAKE_RE = re.compile(r"[a-z_]*")
 
 
 def _add_word_boundaries_to_numbers(string: str) -> str:
-    pattern = re.compile(r"([a-zA-Z])(\d+)([a-zA-Z]?)")
-    return pattern.sub(_space_numbers, string)
+    return _NUM_BOUNDARY_RE.sub(r"\1 \2 \3", string)
 
 
 def _to_camel_init_case(string: str, init_case: bool) -> str:
     string = _add_word_boundaries_to_numbers(string)
-    string = string.strip(" ")
-    n = ""
-    cap_next = init_case
-    for v in string:
-        if (v >= "A" and v <= "Z") or (v >= "0" and v <= "9"):
-            n += v
-        if v >= "a" and v <= "z":
-            if cap_next:
-                n += v.upper()
-            else:
-                n += v
-        if v == "_" or v == " " or v == "-":
-            cap_next = True
-        else:
-            cap_next = False
-    return n
+    words = _WORD_SPLIT_RE.split(string.strip(" "))
+    for i in range(0 if init_case else 1, len(words)):
+        word = words[i]
+        if "a" <= word[:1] <= "z":
+            words[i] = word[0].upper() + word[1:]
+    return _NON_ALNUM_RE.sub("", "".join(words))
 
 
+@lru_cache(maxsize=4096)
 def to_camel(string: str) -> str:
+    if _ALREADY_CAMEL_RE.fullmatch(string):
+        return string
     return _to_camel_init_case(string, True)
 
 
+@lru_cache(maxsize=4096)
 def to_lower_camel(string: str) -> str:
-    if not string:
+    if not string or _ALREADY_LOWER_CAMEL_RE.fullmatch(string):
         return string
     if string[0] >= "A" and string[0] <= "Z":
         string = string[0].lower() + string[1:]
     return _to_camel_init_case(string, False)
 
 
+@lru_cache(maxsize=32)
+def _delimited_boundary_re(delimiter: str) -> re.Pattern[str]:
+    # Split points are word delimiters plus case changes between ASCII letters
+    # past the first character. A single-character delimiter is never emitted
+    # twice in a row, so case changes right after one are skipped; longer
+    # delimiters can double up, which the empty group marks for the join.
+    if len(delimiter) == 1:
+        d = re.escape(_WORD_DELIMITERS + delimiter)
+        pattern = rf"(?<=[^{d}][a-z])(?=[A-Z])|(?<=.)(?<![{d}])(?<![^{d}][a-z])(?=[A-Z][a-z])"
+    else:
+        pattern = r"(?<=.[a-z])(?=[A-Z][a-z])()|(?<=.[a-z])(?=[A-Z])|(?<=.)(?=[A-Z][a-z])"
+    return re.compile(rf"{pattern}|[{re.escape(_WORD_DELIMITERS)}]", re.DOTALL)
+
+
 def _to_screaming_delimited(string: str, delimiter: str, screaming: bool) -> str:
     string = _add_word_boundaries_to_numbers(string)
-    string = string.strip(" ")
-    n = ""
-    for i, v in enumerate(string):
-        next_case_is_changed = False
-        if i + 1 < len(string):
-            next_char = string[i + 1]
-            if (v >= "A" and v <= "Z" and next_char >= "a" and next_char <= "z") or (
-                v >= "a" and v <= "z" and next_char >= "A" and next_char <= "Z"
-            ):
-                next_case_is_changed = True
-
-        if i > 0 and n[-1] != delimiter and next_case_is_changed:
-            if v >= "A" and v <= "Z":
-                n += delimiter + v
-            elif v >= "a" and v <= "z":
-                n += v + delimiter
-        elif v == " " or v == "_" or v == "-":
-            n += delimiter
-        else:
-            n += v
+    boundary_re = _delimited_boundary_re(delimiter)
+    words = boundary_re.split(string.strip(" "))
+    if boundary_re.groups:
+        words = [w for w in words if w is not None]
+    n = delimiter.join(words)
     if screaming:
-        n = n.upper()
-    else:
-        n = n.lower()
-    return n
+        return n.upper()
+    return n.lower()
 
 
+@lru_cache(maxsize=4096)
 def to_delimited(string: str, delimiter: str) -> str:
     return _to_screaming_delimited(string, delimiter, False)
 
 
+@lru_cache(maxsize=4096)
 def to_kebab(string: str) -> str:
-    return to_delimited(string, "-")
+    return _to_screaming_delimited(string, "-", False)
 
 
+@lru_cache(maxsize=4096)
 def to_snake(string: str) -> str:
-    return to_delimited(string, "_")
+    if _ALREADY_SNAKE_RE.fullmatch(string):
+        return string
+    return _to_screaming_delimited(string, "_", False)
 
 
+@lru_cache(maxsize=4096)
 def to_screaming_kebab(string: str) -> str:
     return _to_screaming_delimited(string, "-", True)
 
 
+@lru_cache(maxsize=4096)
 def to_screaming_snake(string: str) -> str:
     return _to_screaming_delimited(string, "_", True)
 
 
+@lru_cache(maxsize=4096)
 def to_screaming_delimited(string: str, delimiter: str) -> str:
     return _to_screaming_delimited(string, delimiter, True)